@@ -3,17 +3,54 @@
 import argparse
 import os
 import glob
-import csv
+from itertools import islice
 import sys
 import re
-from shutil import which, copyfile, copytree
-import datetime
+from shutil import which
+
+# config files that live next to this script, found from here so it works from any directory
+_SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+_KLAYOUT_DEF = os.path.join(_SCRIPT_DIR, 'klayout_def.xml')
+_KLAYOUT_GDS = os.path.join(_SCRIPT_DIR, 'klayout_gds.xml')
+_GDS3D_TECH = os.path.join(_SCRIPT_DIR, 'sky130.txt')
+
+# older OpenLANE run names, eg 15-03_10-30
+_DATESTAMP_RE = re.compile(r'^\d+-\d+_\d+-\d+$')
+
+# antenna report lines with a violation: the whole line, type, value and the allowed ratio
+_ANTENNA_RE = re.compile(rb'^[ \t]+((PAR|CAR):[ \t]+(\d+\.\d+)\*[ \t]+Ratio:[ \t]+(\d+\.\d+).*)$', re.MULTILINE)
+
+# summary report columns worth showing
+_SUMMARY_KEY_RE = re.compile(r'violation|error|AREA|flow_status')
+
+# which() walks the whole of $PATH, so remember the answer per tool
+_which_cache = {}
 
 def is_tool(name):
-    return which(name) is not None
+    if name not in _which_cache:
+        _which_cache[name] = which(name) is not None
+    return _which_cache[name]
+
+def run_tool(cmd):
+    # run an external tool directly rather than through a shell, so paths don't need quoting
+    import subprocess
+    sys.stdout.flush()
+    try:
+        subprocess.run(cmd)
+    except OSError:
+        print("ERROR: couldn't run %s, is it installed?" % cmd[0])
+
+def exec_tool(cmd):
+    # replace this process with the tool, for when there is nothing left to do afterwards
+    sys.stdout.flush()
+    try:
+        os.execvp(cmd[0], cmd)
+    except OSError:
+        exit("ERROR: couldn't run %s, is it installed?" % cmd[0])
 
 def check_path(path):
-    paths = glob.glob(path)
+    # only the first match is used, so stop after two, which is enough to know there were too many
+    paths = list(islice(glob.iglob(path), 2))
     if len(paths) == 0:
         exit("ERROR: file not found: %s" % path)
     if len(paths) > 1:
@@ -21,32 +58,105 @@ def check_path(path):
     
     return paths[0]
 
+def check_paths(directory, names):
+    # find several files in the same directory, only globbing and listing the directory once
+    directory = check_path(directory)
+    with os.scandir(directory) as it:
+        found = {e.name for e in it}
+    for name in names:
+        if name not in found:
+            exit("ERROR: file not found: %s" % os.path.join(directory, name))
+    return [os.path.join(directory, name) for name in names]
+
+def is_run_datestamp(name):
+    # OpenLANE run names, eg RUN_2024.03.15_10.30.00
+    # fixed layout, so checking by position is cheaper than starting up a regex
+    return (len(name) == 23 and name.startswith('RUN_')
+            and name[8] == '.' and name[11] == '.' and name[14] == '_' and name[17] == '.' and name[20] == '.'
+            and (name[4:8] + name[9:11] + name[12:14] + name[15:17] + name[18:20] + name[21:23]).isdigit())
+
 def openlane_date_sort(e):
+    # runs without a recognisable date sort first, ordered by name
+    import datetime
     datestamp = os.path.basename(e)
-    if re.match(r'^RUN_\d+.\d+.\d+\_\d+\.\d+\.\d+$',datestamp):
-        datestamp = datestamp.replace('RUN_', '')
-        timestamp = datetime.datetime.strptime(datestamp, '%Y.%m.%d_%H.%M.%S')
-        return timestamp.timestamp()
+    if is_run_datestamp(datestamp):
+        # fixed layout RUN_YYYY.MM.DD_hh.mm.ss, so reshuffle it for the much quicker fromisoformat
+        d = datestamp
+        timestamp = datetime.datetime.fromisoformat(f"{d[4:8]}-{d[9:11]}-{d[12:14]}T{d[15:17]}:{d[18:20]}:{d[21:23]}")
+        return (1, timestamp.timestamp())
 
-    elif re.match(r'^\d+\-\d+\_\d+\-\d+$',datestamp):
+    elif _DATESTAMP_RE.match(datestamp):
             timestamp = datetime.datetime.strptime(datestamp, '%d-%m_%H-%M')
-            return timestamp.timestamp()
+            return (1, timestamp.timestamp())
+
+    return (0, datestamp)
+
+def list_runs(runs_dir, prefix=''):
+    # same as globbing runs_dir/prefix*, but with one directory listing and no fnmatch per entry
+    try:
+        with os.scandir(runs_dir) as it:
+            return [e.path for e in it if e.is_dir() and e.name.startswith(prefix) and not e.name.startswith('.')]
+    except FileNotFoundError:
+        return []
+
+def latest_run(runs_dir):
+    # newest run by ctime, DirEntry caches the stat so each run is only looked at once
+    # returns None if there aren't any runs
+    try:
+        with os.scandir(runs_dir) as it:
+            runs = (e for e in it if e.is_dir() and not e.name.startswith('.'))
+            latest = max(runs, key=lambda e: e.stat(follow_symlinks=False).st_ctime, default=None)
+    except FileNotFoundError:
+        return None
+    return latest.path if latest is not None else None
+
+def summary_columns(header):
+    # work out which columns of a summary report are interesting, once from the header
+    # returns the (index, name) of violation/error columns and the indices of the area and status columns
+    violation_idx = []
+    area_idx = None
+    status_idx = None
+    for i, key in enumerate(header):
+        m = _SUMMARY_KEY_RE.search(key)
+        if m is None:
+            continue
+        if m.group() == "AREA":
+            area_idx = i
+        elif m.group() == "flow_status":
+            status_idx = i
+        else:
+            violation_idx.append((i, key))
+    return violation_idx, area_idx, status_idx
+
+def read_summary(summary_file):
+    # returns the header and the data rows of a summary report csv
+    with open(summary_file, newline='') as fh:
+        data = fh.read()
 
-    return -1
+    # normally just a header and one row without any quoting, so a plain split will do
+    if data.count('\n') <= 2 and '"' not in data:
+        rows = [line.rstrip('\r').split(',') for line in data.split('\n') if line.rstrip('\r')]
+    else:
+        import csv
+        import io
+        rows = list(csv.reader(io.StringIO(data)))
+
+    # csv.DictReader skipped blank lines, so do the same
+    rows = [r for r in rows if r]
+    return rows[0], rows[1:]
 
 def summary_report(summary_file):
     # print short summary of the csv file
     status = None
-    with open(summary_file) as fh:
-        summary = csv.DictReader(fh)
-        for row in summary:
-            for key, value in row.items():
-                if "violation" in key or "error" in key:
-                    print("%30s : %20s" % (key, value))
-                if "AREA" in key:
-                    area = float(value)
-                if "flow_status" in key:
-                    status = value           
+    header, rows = read_summary(summary_file)
+    violation_idx, area_idx, status_idx = summary_columns(header)
+
+    for row in rows:
+        for i, key in violation_idx:
+            print("%30s : %20s" % (key, row[i]))
+        area = float(row[area_idx])
+        if status_idx is not None:
+            status = row[status_idx]
 
     print("area %d um^2" % (1e6 * area))
     if status is not None: # newer OpenLANE has status, older ones don't
@@ -54,50 +164,71 @@ def summary_report(summary_file):
 
 def full_summary_report(summary_file):
     # print short summary of the csv file
-    with open(summary_file) as fh:
-        summary = csv.DictReader(fh)
-        for row in summary:
-            for key, value in row.items():
-                print("%30s : %20s" % (key, value))
+    header, rows = read_summary(summary_file)
+    for row in rows:
+        sys.stdout.write(''.join("%30s : %20s\n" % (key, value) for key, value in zip(header, row)))
                     
 def drc_report(drc_file):
-    last_drc = None
-    drc_count = 0
     with open(drc_file) as drc:
-        for line in drc.readlines():
-            print(line.strip())
+        # writelines drives the loop from C rather than one print() call per line
+        sys.stdout.writelines(line.strip() + '\n' for line in drc)
 
 def antenna_report(antenna_report):
+    import mmap
     violations = 0
-    with open(antenna_report) as ant:
-        for line in ant.readlines():
-            m = re.match(r'\s+(PAR|CAR):\s+(\d+.\d+)\*\s+Ratio:\s+(\d+.\d+)', line)
-            if m is not None:
+    with open(antenna_report, 'rb') as ant:
+        # can't mmap an empty file, and there is nothing to report anyway
+        if os.fstat(ant.fileno()).st_size == 0:
+            return
+        # let the regex engine find the violations in the whole report rather than looping over lines
+        with mmap.mmap(ant.fileno(), 0, access=mmap.ACCESS_READ) as report:
+            for m in _ANTENNA_RE.finditer(report):
                 violations += 1
-                violation = float(m.group(2))
-                ratio = float(m.group(3))
+                line = m.group(1).decode().strip()
+                violation = float(m.group(3))
+                ratio = float(m.group(4))
                 if violation > (ratio * 2):
-                    print(line.strip(), ": worth fixing")
+                    print(line, ": worth fixing")
                 else:
-                    print(line.strip(), ": can ignore")
+                    print(line, ": can ignore")
 
     if violations > 0:
         print("For more info on antenna reports see https://www.zerotoasiccourse.com/terminology/antenna-report/")
 
+# regression runs nearly always share the same header, so only work out its columns once
+_regression_columns_cache = {}
+
+def regression_columns(header):
+    # returns the index of flow_status and the indices of the violation/error columns
+    key = tuple(header)
+    if key not in _regression_columns_cache:
+        violation_idx = [i for i, k in enumerate(header) if 'violations' in k or 'error' in k]
+        _regression_columns_cache[key] = (header.index('flow_status'), violation_idx)
+    return _regression_columns_cache[key]
+
+def load_regression_summary(run_path):
+    # returns the violation and error counts of a completed regression run, or None
+    summary_file = os.path.join(run_path, "reports", "final_summary_report.csv")
+    try:
+        header, rows = read_summary(summary_file)
+    except FileNotFoundError:
+        # print(f"run {os.path.basename(run_path)} summary file not found")
+        return None
+    summary = rows[0]
+    status_idx, violation_idx = regression_columns(header)
+    if summary[status_idx] != 'Flow_completed':
+        # print(f"run {os.path.basename(run_path)} did not complete : {summary[status_idx]}")
+        return None
+    return [summary[i] for i in violation_idx]
+
 def check_and_sort_regressions(regressions):
-    summaries = {}
-    for run_path in regressions:
-        summary_file = os.path.join(run_path, "reports", "final_summary_report.csv")
-        if not os.path.exists(summary_file):
-            # print(f"run {os.path.basename(run_path)} summary file not found")
-            continue
-        with open(summary_file) as fh:
-            summary = next(csv.DictReader(fh))
-        if summary['flow_status'] != 'Flow_completed':
-            # print(f"run {os.path.basename(run_path)} did not complete : {summary['flow_status']}")
-            continue
-        summaries[run_path] = summary
-    violations = {rp: sum(int(v) for k, v in summary.items() if ('violations' in k or 'error' in k) and int(v) >= 0) for rp, summary in summaries.items()}
+    from concurrent.futures import ThreadPoolExecutor
+    # each run is just a small file read, so overlap them
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        loaded = pool.map(load_regression_summary, regressions)
+        summaries = {run_path: summary for run_path, summary in zip(regressions, loaded) if summary is not None}
+    # negative counts mean the check wasn't run, so leave them out
+    violations = {rp: sum(n for n in map(int, summary) if n >= 0) for rp, summary in summaries.items()}
     for rp, n in violations.items():
         print(f"found regression run {os.path.basename(rp)} with {n} violations")
     return sorted(
@@ -105,6 +236,61 @@ def check_and_sort_regressions(regressions):
         key=lambda rp: violations[rp]
         )
 
+def show_drc(run_path):
+    path = os.path.join(run_path, 'reports', 'signoff', 'drc.rpt') # don't check path because if DRC is clean, don't get the file
+    if os.path.exists(path):
+        drc_report(path)
+    else:
+        print("no DRC file, DRC clean?")
+
+def show_synth(run_path):
+    path = check_path(os.path.join(run_path, "tmp", "synthesis", "post_techmap.dot")) # post_techmap is created by https://github.com/efabless/openlane/pull/282
+    print(path)
+    run_tool(['xdot', path])
+
+def show_yosys_report(run_path):
+    from shutil import copyfileobj
+    filename = "*synthesis*.stat.*"
+    path = check_path(os.path.join(run_path, "reports", "synthesis", filename))
+    with open(path) as report:
+        copyfileobj(report, sys.stdout)
+
+def show_antenna(run_path):
+    filename = "*antenna_violators.rpt"
+    path = check_path(os.path.join(run_path, "reports", "signoff", filename))
+    if os.path.exists(path):
+        antenna_report(path)
+    else:
+        print("no antenna file, did the run finish?")
+
+def copy_final(run_path):
+    from concurrent.futures import ThreadPoolExecutor
+    from shutil import copy2, copyfile, copytree
+    path = check_path(os.path.join(run_path, "results", "final"))
+
+    # copytree makes the directories, but hands each file copy to the pool so they overlap
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        copies = []
+        copytree(path, "final", copy_function=lambda src, dst: copies.append(pool.submit(copy2, src, dst)))
+
+        # also take the pdk and openlane versions
+        path = check_path(os.path.join(run_path, "OPENLANE_VERSION"))
+        copies.append(pool.submit(copyfile, path, os.path.join("final", "OPENLANE_VERSION")))
+        path = check_path(os.path.join(run_path, "PDK_SOURCES"))
+        copies.append(pool.submit(copyfile, path, os.path.join("final", "PDK_SOURCES")))
+
+        # raise the first error, if any
+        for copy in copies:
+            copy.result()
+
+def show_gds_3d(run_path, top):
+    if not is_tool('GDS3D'):
+        print("ERROR: Couldn't find GDS3D.")
+        exit("Please install GDS3D from https://github.com/trilomix/GDS3D")
+    path = check_path(os.path.join(run_path, "results", "final", "gds", top + ".gds"))
+    # always the last action, so no need to come back afterwards
+    exec_tool(['GDS3D', '-p', _GDS3D_TECH, '-i', path])
+
 
 if __name__ == '__main__':
     parser = argparse.ArgumentParser(description="OpenLANE summary tool")
@@ -150,20 +336,17 @@ if __name__ == '__main__':
     if not args.top:
         args.top = args.design 
 
-    if not 'OPENLANE_ROOT' in os.environ:
+    openlane_root = os.environ.get('OPENLANE_ROOT')
+    if not openlane_root:
         exit("please set OPENLANE_ROOT to where your OpenLane is installed")
-    if not 'PDK_ROOT' in os.environ:
+    pdk_root = os.environ.get('PDK_ROOT')
+    if not pdk_root:
         exit("please set PDK_ROOT to where your PDK is installed")
 
-    klayout_def = os.path.join(os.path.dirname(sys.argv[0]), 'klayout_def.xml')
-    klayout_gds = os.path.join(os.path.dirname(sys.argv[0]), 'klayout_gds.xml')
-    gds3d_tech  = os.path.join(os.path.dirname(sys.argv[0]), 'sky130.txt')
-
     # if showing off the sky130 cells
     if args.show_sky130:
-        path = check_path(os.path.join(os.environ['PDK_ROOT'], "sky130A", "libs.ref", "sky130_fd_sc_hd", "gds", "sky130_fd_sc_hd.gds"))
-        os.system("klayout -l %s %s" % (klayout_gds, path))
-        exit()
+        path = check_path(os.path.join(pdk_root, "sky130A", "libs.ref", "sky130_fd_sc_hd", "gds", "sky130_fd_sc_hd.gds"))
+        exec_tool(['klayout', '-l', _KLAYOUT_GDS, path])
 
     # otherwise need to know where openlane and the designs are
     openlane_designs = ''
@@ -172,47 +355,56 @@ if __name__ == '__main__':
             openlane_designs = 'openlane'
         else:
             openlane_designs = '.'
-        run_dir = os.path.join(openlane_designs, args.design, 'runs/*')
+        runs_dir = os.path.join(openlane_designs, args.design, 'runs')
+        run_prefix = ''
 
     else:
-        openlane_designs = os.path.join(os.environ['OPENLANE_ROOT'], 'designs')
+        openlane_designs = os.path.join(openlane_root, 'designs')
         if args.regression:
-            run_dir = os.path.join(openlane_designs, args.design, 'config_regression_*')
+            runs_dir = os.path.join(openlane_designs, args.design)
+            run_prefix = 'config_regression_'
         else:
-            run_dir = os.path.join(openlane_designs, args.design, 'runs', '*')
+            runs_dir = os.path.join(openlane_designs, args.design, 'runs')
+            run_prefix = ''
 
-    print(run_dir)
+    print(os.path.join(runs_dir, run_prefix + '*'))
+
+    if not args.regression and args.run == -1:
+        # default is to use the latest, which only needs a running max over the runs, no list or sort
+        run_path = latest_run(runs_dir)
+        if run_path is None:
+            exit("couldn't find that design")
+        print("using latest run:")
 
-    list_of_files = glob.glob(run_dir)
-    if len(list_of_files) == 0:
-        exit("couldn't find that design")
-    if args.regression:
-        print(f"found {len(list_of_files)} regression variants, sorting by number of violations")
-        list_of_files = check_and_sort_regressions(list_of_files)
-        if len(list_of_files) == 0:
-            exit("no successful regression runs found")
-        run_path = list_of_files[0]
     else:
-        list_of_files.sort(key=openlane_date_sort)
-        # what run to show?
-        if args.run == -1:
-            # default is to use the latest
-            print("using latest run:")
-            run_path = max(list_of_files, key=os.path.getctime)
-
-        elif args.run is None:
-            # UI for asking for which run to use
-            for run_index, run in enumerate(list_of_files):
-                print("\n%2d: %s" % (run_index, os.path.basename(run)), end='')
-            print(" <default>\n")
-
-            n = input("which run? <enter for default>: ") or run_index
-            run_path = list_of_files[int(n)]
+        list_of_files = list_runs(runs_dir, run_prefix)
+        if len(list_of_files) == 0:
+            exit("couldn't find that design")
+
+        if args.regression:
+            print(f"found {len(list_of_files)} regression variants, sorting by number of violations")
+            list_of_files = check_and_sort_regressions(list_of_files)
+            if len(list_of_files) == 0:
+                exit("no successful regression runs found")
+            run_path = list_of_files[0]
 
         else:
-            # use the given run
-            print("using run %d:" % args.run)
-            run_path = list_of_files[args.run]
+            # sort() computes each key once per run, not once per comparison
+            list_of_files.sort(key=openlane_date_sort)
+
+            if args.run is None:
+                # UI for asking for which run to use
+                for run_index, run in enumerate(list_of_files):
+                    print("\n%2d: %s" % (run_index, os.path.basename(run)), end='')
+                print(" <default>\n")
+
+                n = input("which run? <enter for default>: ") or run_index
+                run_path = list_of_files[int(n)]
+
+            else:
+                # use the given run
+                print("using run %d:" % args.run)
+                run_path = list_of_files[args.run]
 
     print(run_path)
 
@@ -222,89 +414,39 @@ if __name__ == '__main__':
     if not os.path.exists(lef_path):
         print(f"no LEF file found, {def_warning}")
 
-    klayout_tech = "/volare/sky130/versions/*/sky130A/libs.tech/klayout/tech/"
-    lyt = check_path(os.environ['PDK_ROOT'] + klayout_tech + "sky130A.lyt")
+    klayout_tech = pdk_root + "/volare/sky130/versions/*/sky130A/libs.tech/klayout/tech/"
+    lyt, lyp, lym = check_paths(klayout_tech, ["sky130A.lyt", "sky130A.lyp", "sky130A.map"])
     if not lyt:
         print("sky130A.lyt not found in PDK_ROOT, {def_warning}")
 
-    lyp = check_path(os.environ['PDK_ROOT'] + klayout_tech + "sky130A.lyp")
     if not lyp:
         print("sky130A.lyp not found in PDK_ROOT, {def_warning}")
 
-    lym = check_path(os.environ['PDK_ROOT'] + klayout_tech + "sky130A.map")
     if not lym:
         print("sky130A.map not found in PDK_ROOT, {def_warning}")
         
-    if args.summary:
-        path = check_path(os.path.join(run_path, 'reports', 'metrics.csv'))
-        summary_report(path)
-
-    if args.full_summary:
-        path = check_path(os.path.join(run_path, 'reports', 'metrics.csv'))
-        full_summary_report(path)
-
-    if args.drc:
-        path = os.path.join(run_path, 'reports', 'signoff', 'drc.rpt') # don't check path because if DRC is clean, don't get the file
-        if os.path.exists(path):
-            drc_report(path)
-        else:
-            print("no DRC file, DRC clean?")
-
-    if args.synth:
-        path = check_path(os.path.join(run_path, "tmp", "synthesis", "post_techmap.dot")) # post_techmap is created by https://github.com/efabless/openlane/pull/282
-        print(path)
-        os.system("xdot %s" % path)
-
-    if args.yosys_report:
-        filename = "*synthesis*.stat.*"
-        path = check_path(os.path.join(run_path, "reports", "synthesis", filename))
-        os.system("cat '%s'" % path)
-
-    if args.antenna:
-        filename = "*antenna_violators.rpt"
-        path = check_path(os.path.join(run_path, "reports", "signoff", filename))
-        if os.path.exists(path):
-            antenna_report(path)
-        else:
-            print("no antenna file, did the run finish?")
-
-    # these next 4 all need to use a special script to open them as they are def files
-    open_design = "$OPENLANE_ROOT/scripts/klayout/open_design.py"
-    if args.floorplan:
-        path = check_path(os.path.join(run_path, "tmp", "floorplan", "4*def"))
-        os.system(f"{open_design} --input-lef {lef_path} --lyt {lyt} --lym {lym} --lyp {lyp} {path}")
-
-    if args.pdn:
-        path = check_path(os.path.join(run_path, "results", "floorplan", "*def"))
-        os.system(f"{open_design} --input-lef {lef_path} --lyt {lyt} --lym {lym} --lyp {lyp} {path}")
-
-    if args.global_placement:
-        path = check_path(os.path.join(run_path, "tmp", "placement", "*global.def"))
-        os.system(f"{open_design} --input-lef {lef_path} --lyt {lyt} --lym {lym} --lyp {lyp} {path}")
-
-    if args.detailed_placement:
-        path = check_path(os.path.join(run_path, "results", "placement", args.top + ".def"))
-        os.system(f"{open_design} --input-lef {lef_path} --lyt {lyt} --lym {lym} --lyp {lyp} {path}")
-
-    # gds doesn't need a lef
-    if args.gds:
-        path = check_path(os.path.join(run_path, "results", "signoff", args.top + ".gds"))
-        os.system("klayout -l %s %s" % (klayout_gds, path))
-
-    if args.copy_final:
-        path = check_path(os.path.join(run_path, "results", "final"))
-        copytree(path, "final")
-
-        # also take the pdk and openlane versions
-        path = check_path(os.path.join(run_path, "OPENLANE_VERSION"))
-        copyfile(path, os.path.join("final", "OPENLANE_VERSION"))
-        path = check_path(os.path.join(run_path, "PDK_SOURCES"))
-        copyfile(path, os.path.join("final", "PDK_SOURCES"))
-
-    if args.gds_3d:
-        if not is_tool('GDS3D'):
-            print("ERROR: Couldn't find GDS3D.")
-            exit("Please install GDS3D from https://github.com/trilomix/GDS3D")
-        path = check_path(os.path.join(run_path, "results", "final", "gds", args.top + ".gds"))
-        os.system("GDS3D -p %s -i %s" % (gds3d_tech, path))
-        
+    # these four all need to use a special script to open them as they are def files
+    open_design = os.path.join(openlane_root, "scripts", "klayout", "open_design.py")
+    def_args = ['--input-lef', lef_path, '--lyt', lyt, '--lym', lym, '--lyp', lyp]
+
+    # what to do for each option, several can be given at once and they run in this order
+    actions = {
+        'summary':              lambda: summary_report(check_path(os.path.join(run_path, 'reports', 'metrics.csv'))),
+        'full_summary':         lambda: full_summary_report(check_path(os.path.join(run_path, 'reports', 'metrics.csv'))),
+        'drc':                  lambda: show_drc(run_path),
+        'synth':                lambda: show_synth(run_path),
+        'yosys_report':         lambda: show_yosys_report(run_path),
+        'antenna':              lambda: show_antenna(run_path),
+        'floorplan':            lambda: run_tool([open_design, *def_args, check_path(os.path.join(run_path, "tmp", "floorplan", "4*def"))]),
+        'pdn':                  lambda: run_tool([open_design, *def_args, check_path(os.path.join(run_path, "results", "floorplan", "*def"))]),
+        'global_placement':     lambda: run_tool([open_design, *def_args, check_path(os.path.join(run_path, "tmp", "placement", "*global.def"))]),
+        'detailed_placement':   lambda: run_tool([open_design, *def_args, check_path(os.path.join(run_path, "results", "placement", args.top + ".def"))]),
+        # gds doesn't need a lef
+        'gds':                  lambda: run_tool(['klayout', '-l', _KLAYOUT_GDS, check_path(os.path.join(run_path, "results", "signoff", args.top + ".gds"))]),
+        'copy_final':           lambda: copy_final(run_path),
+        'gds_3d':               lambda: show_gds_3d(run_path, args.top),
+    }
+
+    for name, action in actions.items():
+        if getattr(args, name):
+            action()